@@ -0,0 +1,32 @@
+"""
+Build Script
+Pre-compiles the application's modules to bytecode so the first launch
+doesn't have to parse the sources. Ship the generated __pycache__
+directories together with the .py files.
+"""
+import compileall
+import os
+import re
+import sys
+
+# Directories that aren't part of the application
+EXCLUDE = re.compile(r"[\\/](\.git|\.venv|venv|assets)([\\/]|$)")
+
+
+def build():
+    """Compile every module in the project directory."""
+    project_dir = os.path.dirname(os.path.abspath(__file__))
+    
+    # optimize=-1 matches the interpreter running this script, so the
+    # generated .pyc files are the ones `python main.py` will look for
+    return compileall.compile_dir(
+        project_dir,
+        rx=EXCLUDE,
+        quiet=1,
+        legacy=False,
+        optimize=-1
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(0 if build() else 1)
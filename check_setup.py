@@ -2,6 +2,7 @@
 Setup Checker Script
 Run this to verify your setup before running the application.
 """
+import importlib.util
 import sys
 
 def check_setup():
@@ -24,15 +25,16 @@ def check_setup():
     dependencies = {
         'requests': 'requests',
         'PIL': 'Pillow',
-        'tkinter': 'tkinter (built-in)'
+        # The C extension; the pure-Python tkinter package can exist without it
+        '_tkinter': 'tkinter (built-in)'
     }
     
     missing = []
     for module, package in dependencies.items():
-        try:
-            __import__(module)
+        # find_spec only locates the module, it doesn't run its __init__
+        if importlib.util.find_spec(module) is not None:
             print(f"  ✓ {package}")
-        except ImportError:
+        else:
             print(f"  ✗ {package} - MISSING")
             missing.append(package)
     print()
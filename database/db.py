@@ -1,17 +1,32 @@
 import sqlite3
+import threading
+
+DB_PATH = "users.db"  # database file
+
+# Shared connection, opened on first use and kept for the life of the app
+_conn = None
+
+# Serializes access to the shared connection across threads
+db_lock = threading.RLock()
 
 def connect_db():
-    conn = sqlite3.connect("users.db")  # database file
-    return conn
+    """Return the shared database connection, opening it on first use."""
+    global _conn
+    with db_lock:
+        if _conn is None:
+            _conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+            _conn.execute("PRAGMA journal_mode=WAL")
+            _conn.execute("PRAGMA synchronous=NORMAL")
+        return _conn
 
 def create_users_table():
     conn = connect_db()
-    cursor = conn.cursor()
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS users (
-            username TEXT PRIMARY KEY,
-            password TEXT NOT NULL
-        )
-    """)
-    conn.commit()
-    conn.close()
\ No newline at end of file
+    with db_lock:
+        cursor = conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS users (
+                username TEXT PRIMARY KEY,
+                password TEXT NOT NULL
+            )
+        """)
+        conn.commit()
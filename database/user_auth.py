@@ -1,21 +1,37 @@
 import hashlib
+import hmac
 import os
-from .db import connect_db
+import sqlite3
+from .db import connect_db, db_lock
 
-def hash_password(password, salt=None):
+# PBKDF2 settings for newly stored passwords
+PBKDF2_ALGORITHM = "sha256"
+PBKDF2_ITERATIONS = 200_000
+
+def hash_password(password, salt=None, iterations=PBKDF2_ITERATIONS):
     """
-    Hash a password with a salt using SHA-256.
+    Hash a password with a salt using PBKDF2-HMAC-SHA256.
     If no salt is provided, generate a new one.
-    Returns the salt and hashed password as a combined string.
+    Returns the iteration count, salt and hashed password as a combined string.
     """
     if salt is None:
         salt = os.urandom(32).hex()  # Generate a random 32-byte salt
     
-    # Combine password and salt, then hash
+    # Stretch the password with many rounds of HMAC-SHA256
+    hashed = hashlib.pbkdf2_hmac(
+        PBKDF2_ALGORITHM, password.encode(), bytes.fromhex(salt), iterations, 32
+    ).hex()
+    
+    # Return pbkdf2$iterations$salt$hash format for storage
+    return f"pbkdf2${iterations}${salt}${hashed}"
+
+def _hash_password_legacy(password, salt):
+    """
+    Hash a password in the old single-round SHA-256 salt:hash format.
+    Only used to verify passwords stored before the switch to PBKDF2.
+    """
     password_with_salt = (password + salt).encode()
     hashed = hashlib.sha256(password_with_salt).hexdigest()
-    
-    # Return salt:hash format for storage
     return f"{salt}:{hashed}"
 
 def verify_user(username, password):
@@ -23,24 +39,32 @@ def verify_user(username, password):
     Verify a user's credentials against the database.
     """
     conn = connect_db()
-    cursor = conn.cursor()
-    cursor.execute("SELECT password FROM users WHERE username=?", (username,))
-    result = cursor.fetchone()
-    conn.close()
+    with db_lock:
+        cursor = conn.cursor()
+        cursor.execute("SELECT password FROM users WHERE username=?", (username,))
+        result = cursor.fetchone()
     
     if result is None:
         return False
     
     stored_password = result[0]
     
-    # Extract salt and hash from stored password
-    if ':' in stored_password:
+    # Extract iterations, salt and hash from stored password
+    if stored_password.startswith("pbkdf2$"):
+        try:
+            _, iterations, salt, _ = stored_password.split('$', 3)
+            hashed_input = hash_password(password, salt, int(iterations))
+        except (ValueError, OverflowError):
+            return False  # Malformed hash; treat as a failed login
+    elif ':' in stored_password:
+        # Legacy salt:hash format
         salt, _ = stored_password.split(':', 1)
-        hashed_input = hash_password(password, salt)
-        return hashed_input == stored_password
+        hashed_input = _hash_password_legacy(password, salt)
     else:
         # Fallback for old format (if any exist)
-        return hashlib.sha256(password.encode()).hexdigest() == stored_password
+        hashed_input = hashlib.sha256(password.encode()).hexdigest()
+    # Compare bytes; compare_digest rejects str arguments with non-ASCII text
+    return hmac.compare_digest(hashed_input.encode(), stored_password.encode())
 
 # Optional: pre-insert a test user
 def add_test_user():
@@ -48,11 +72,16 @@ def add_test_user():
     Add a test user (admin/admin123) for demonstration purposes.
     """
     conn = connect_db()
-    cursor = conn.cursor()
-    test_user = ("admin", hash_password("admin123"))
-    try:
-        cursor.execute("INSERT INTO users(username,password) VALUES (?,?)", test_user)
-        conn.commit()
-    except:
-        pass  # User already exists
-    conn.close()
+    with db_lock:
+        cursor = conn.cursor()
+        # Skip the (deliberately slow) password hash when the user already exists
+        cursor.execute("SELECT 1 FROM users WHERE username=?", ("admin",))
+        if cursor.fetchone():
+            return
+        
+        test_user = ("admin", hash_password("admin123"))
+        try:
+            cursor.execute("INSERT INTO users(username,password) VALUES (?,?)", test_user)
+            conn.commit()
+        except sqlite3.IntegrityError:
+            conn.rollback()  # User already exists
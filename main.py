@@ -7,7 +7,6 @@ import tkinter as tk
 from database.db import create_users_table
 from database.user_auth import add_test_user
 from ui.login_window import LoginWindow
-from ui.movie_app import MovieApp
 
 
 def main():
@@ -18,6 +17,9 @@ def main():
     
     def on_login_success(username):
         """Callback when login is successful."""
+        # Imported here so the login screen doesn't load the movie UI stack
+        from ui.movie_app import MovieApp
+        
         app_root = tk.Tk()
         MovieApp(app_root, username)
         app_root.mainloop()
@@ -3,11 +3,10 @@ Movie/TV Show Details Dialog
 Shows detailed information including overview, cast, trailer, etc.
 """
 import tkinter as tk
-from tkinter import ttk, messagebox
-import webbrowser
+from tkinter import ttk
+import threading
 from services.tmdb_api import (
-    get_movie_details, get_tv_details, 
-    get_movie_videos, get_tv_videos,
+    get_movie_bundle, get_tv_bundle,
     get_youtube_url, get_backdrop_url, get_poster_url
 )
 from media.image_utils import download_image, get_placeholder_image
@@ -45,7 +44,7 @@ class DetailsDialog:
         self.show_loading()
         
         # Load details in background
-        self.dialog.after(100, self.load_details)
+        self.load_details()
     
     def center_window(self):
         """Center the dialog on screen."""
@@ -84,24 +83,36 @@ class DetailsDialog:
             self.dialog.after(300, self.animate_loading)
     
     def load_details(self):
-        """Load detailed information from TMDb API."""
-        try:
-            # Fetch details
-            if self.item_type == "movie":
-                details = get_movie_details(self.item_id)
-                videos = get_movie_videos(self.item_id)
-            else:
-                details = get_tv_details(self.item_id)
-                videos = get_tv_videos(self.item_id)
-            
-            if details:
-                self.show_details(details, videos)
-            else:
-                self.show_error("Failed to load details. Please try again.")
-                
-        except Exception as e:
-            print(f"Error loading details: {e}")
-            self.show_error(f"Error: {e}")
+        """Load detailed information from TMDb API in a background thread."""
+        def fetch_details():
+            details, videos, error = None, [], None
+            try:
+                # Fetch details and videos in parallel
+                if self.item_type == "movie":
+                    details, videos = get_movie_bundle(self.item_id)
+                else:
+                    details, videos = get_tv_bundle(self.item_id)
+            except Exception as e:
+                print(f"Error loading details: {e}")
+                error = e
+            try:
+                self.dialog.after(0, lambda: self.on_details_loaded(details, videos, error))
+            except (RuntimeError, tk.TclError):
+                pass  # Dialog already closed
+        
+        threading.Thread(target=fetch_details, daemon=True).start()
+    
+    def on_details_loaded(self, details, videos, error):
+        """Callback when details are loaded."""
+        if not self.dialog.winfo_exists():
+            return
+        
+        if error:
+            self.show_error(f"Error: {error}")
+        elif details:
+            self.show_details(details, videos)
+        else:
+            self.show_error("Failed to load details. Please try again.")
     
     def show_error(self, message):
         """Show error message."""
@@ -123,8 +134,11 @@ class DetailsDialog:
         if hasattr(self, 'loading_frame'):
             self.loading_frame.destroy()
         
+        # Bind the lookup once; it is used for every field below
+        get = details.get
+        
         # Update title
-        title = details.get('title') if self.item_type == "movie" else details.get('name')
+        title = get('title') if self.item_type == "movie" else get('name')
         self.dialog.title(title)
         
         # Create scrollable content
@@ -143,13 +157,15 @@ class DetailsDialog:
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Enable mouse wheel scrolling
-        canvas.bind_all("<MouseWheel>", lambda e: canvas.yview_scroll(int(-1 * (e.delta / 120)), "units"))
+        # Enable mouse wheel scrolling. Bound on the dialog (part of every child's
+        # bindtags) rather than globally, so it goes away with the dialog.
+        self.dialog.bind("<MouseWheel>", lambda e: self._on_mousewheel(canvas, e))
         
         # Header with backdrop
-        backdrop_path = details.get('backdrop_path')
+        backdrop_path = get('backdrop_path')
         if backdrop_path:
-            backdrop_url = get_backdrop_url(backdrop_path)
+            # w780 is the smallest backdrop that covers the 780px header
+            backdrop_url = get_backdrop_url(backdrop_path, size="w780")
             backdrop_img = download_image(backdrop_url, width=780, height=300)
             if backdrop_img:
                 self.image_references.append(backdrop_img)
@@ -173,17 +189,17 @@ class DetailsDialog:
         
         # Metadata
         if self.item_type == "movie":
-            release_date = details.get('release_date', 'N/A')
-            runtime = details.get('runtime', 0)
+            release_date = get('release_date', 'N/A')
+            runtime = get('runtime', 0)
             runtime_text = f"{runtime} min" if runtime else "N/A"
             metadata = f"📅 {release_date} • ⏱️ {runtime_text}"
         else:
-            first_air_date = details.get('first_air_date', 'N/A')
-            seasons = details.get('number_of_seasons', 0)
-            episodes = details.get('number_of_episodes', 0)
+            first_air_date = get('first_air_date', 'N/A')
+            seasons = get('number_of_seasons', 0)
+            episodes = get('number_of_episodes', 0)
             metadata = f"📅 {first_air_date} • 📺 {seasons} Seasons, {episodes} Episodes"
         
-        rating = details.get('vote_average', 0)
+        rating = get('vote_average', 0)
         metadata += f" • ⭐ {rating:.1f}/10"
         
         tk.Label(
@@ -195,7 +211,7 @@ class DetailsDialog:
         ).pack(anchor=tk.W, padx=15, pady=(0, 10))
         
         # Genres
-        genres = details.get('genres', [])
+        genres = get('genres', [])
         if genres:
             genre_text = " | ".join([g['name'] for g in genres[:5]])
             tk.Label(
@@ -207,7 +223,7 @@ class DetailsDialog:
             ).pack(anchor=tk.W, padx=15, pady=(0, 15))
         
         # Overview
-        overview = details.get('overview', 'No overview available.')
+        overview = get('overview', 'No overview available.')
         tk.Label(
             info_frame,
             text="Overview",
@@ -268,8 +284,8 @@ class DetailsDialog:
         
         if self.item_type == "movie":
             # Budget and revenue
-            budget = details.get('budget', 0)
-            revenue = details.get('revenue', 0)
+            budget = get('budget', 0)
+            revenue = get('revenue', 0)
             
             if budget > 0:
                 self.add_info_row(additional_frame, "Budget", f"${budget:,}")
@@ -277,16 +293,16 @@ class DetailsDialog:
                 self.add_info_row(additional_frame, "Revenue", f"${revenue:,}")
             
             # Production companies
-            companies = details.get('production_companies', [])
+            companies = get('production_companies', [])
             if companies:
                 company_names = ", ".join([c['name'] for c in companies[:3]])
                 self.add_info_row(additional_frame, "Production", company_names)
         else:
             # TV specific info
-            status = details.get('status', 'N/A')
+            status = get('status', 'N/A')
             self.add_info_row(additional_frame, "Status", status)
             
-            networks = details.get('networks', [])
+            networks = get('networks', [])
             if networks:
                 network_names = ", ".join([n['name'] for n in networks])
                 self.add_info_row(additional_frame, "Network", network_names)
@@ -306,6 +322,11 @@ class DetailsDialog:
         )
         close_btn.pack(pady=20)
     
+    def _on_mousewheel(self, canvas, event):
+        """Scroll the details canvas and stop the event reaching global bindings."""
+        canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        return "break"
+    
     def add_info_row(self, parent, label, value):
         """Add an information row."""
         row_frame = tk.Frame(parent, bg="#2d2d2d")
@@ -333,6 +354,9 @@ class DetailsDialog:
     
     def open_trailer(self, video_key):
         """Open trailer in web browser."""
+        import webbrowser
+        from tkinter import messagebox
+        
         try:
             url = get_youtube_url(video_key)
             webbrowser.open(url)
@@ -2,22 +2,91 @@
 Image Utilities Module
 Handles downloading and processing images for the application.
 """
-import requests
-from PIL import Image, ImageTk
+from PIL import Image, ImageTk, ImageDraw, ImageFont
 from io import BytesIO
+from collections import OrderedDict
+import hashlib
+import math
 import os
+import threading
 
 # Cache directory for downloaded posters
 CACHE_DIR = "assets/images/posters"
 
+# Maximum number of decoded images kept in memory
+MEMORY_CACHE_SIZE = 128
+
+# Images within this fraction of the target size are used without resizing
+RESIZE_TOLERANCE = 0.05
+
+# Decoded PIL images keyed by (url, width, height), least recently used first.
+# PIL images are cached rather than PhotoImages since Tk images are not thread-safe.
+_memory_cache = OrderedDict()
+_memory_cache_lock = threading.Lock()
+
+# Placeholder PhotoImages keyed by (width, height)
+_placeholder_cache = {}
+
+# Shared HTTP session so poster downloads reuse keep-alive connections
+_session = None
+_session_lock = threading.Lock()
+
+def _load_font(name, size):
+    """Load a TrueType font, falling back to PIL's default font."""
+    try:
+        return ImageFont.truetype(name, size)
+    except OSError:
+        try:
+            return ImageFont.load_default(size)
+        except TypeError:
+            # Pillow (and Pillow-SIMD) releases before 10.1 have no size argument
+            return ImageFont.load_default()
+
+# Fonts are loaded once at import rather than for every image drawn
+PLACEHOLDER_FONT = _load_font("arial.ttf", 16)
+TITLE_FONT = _load_font("arialbd.ttf", 18)
+RATING_FONT = _load_font("arialbd.ttf", 16)
+YEAR_FONT = _load_font("arial.ttf", 13)
+
 def ensure_cache_dir():
     """Create cache directory if it doesn't exist."""
     if not os.path.exists(CACHE_DIR):
-        os.makedirs(CACHE_DIR)
+        os.makedirs(CACHE_DIR, exist_ok=True)
 
-def download_image(url, width=150, height=225):
+# The disk cache is best-effort; without it posters are only cached in memory
+try:
+    ensure_cache_dir()
+    _disk_cache_enabled = True
+except OSError:
+    _disk_cache_enabled = False
+
+def _get_session():
+    """Return the shared requests session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            # Imported lazily - only needed on a cache miss
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            _session = requests.Session()
+            _session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=16))
+        return _session
+
+def _close_to_size(size, width, height):
+    """Check whether an image size is within RESIZE_TOLERANCE of the target size."""
+    return (abs(size[0] - width) <= width * RESIZE_TOLERANCE
+            and abs(size[1] - height) <= height * RESIZE_TOLERANCE)
+
+def _cache_path(url, width, height):
+    """Build the on-disk cache path for a resized image."""
+    key = hashlib.sha1(url.encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}_{width}x{height}.jpg")
+
+def fetch_and_decode_to_pil(url, width=150, height=225):
     """
-    Download an image from a URL and return it as a PhotoImage.
+    Load a resized PIL image from the memory cache, the disk cache or the network.
+    Safe to call from worker threads.
     
     Args:
         url: The URL of the image
@@ -25,29 +94,98 @@ def download_image(url, width=150, height=225):
         height: Target height for the image
     
     Returns:
-        ImageTk.PhotoImage object, or None if download fails
+        PIL.Image object, or None if download fails
+    """
+    cache_key = (url, width, height)
+    with _memory_cache_lock:
+        image = _memory_cache.get(cache_key)
+        if image is not None:
+            _memory_cache.move_to_end(cache_key)
+            return image
+    
+    try:
+        path = _cache_path(url, width, height)
+        if os.path.exists(path):
+            # Warm cache - read the already resized JPEG from disk
+            image = Image.open(path)
+            image.load()
+        else:
+            # Reduced timeout for faster failures
+            response = _get_session().get(url, timeout=5)
+            response.raise_for_status()
+            
+            # Open image from bytes
+            image = Image.open(BytesIO(response.content))
+            
+            # Let libjpeg decode at a reduced scale that is still >= the target size
+            image.draft('RGB', (width, height))
+            
+            # Image.open is lazy - decode here so it never happens on the Tk main thread
+            image.load()
+            
+            # Resize image with faster algorithm for speed (vectorised under Pillow-SIMD),
+            # unless the server already sent it at about the right size
+            if not _close_to_size(image.size, width, height):
+                image = image.resize((width, height), Image.Resampling.BILINEAR)
+            image = image.convert('RGB')
+            
+            # Write to a temporary file first so a partial write is never picked up
+            if _disk_cache_enabled:
+                try:
+                    temp_path = f"{path}.{threading.get_ident()}.tmp"
+                    image.save(temp_path, 'JPEG', quality=85)
+                    os.replace(temp_path, path)
+                except OSError:
+                    pass  # Caching is best-effort
+    except Exception:
+        # Silent failure - just return None, don't print every error
+        return None
+    
+    with _memory_cache_lock:
+        _memory_cache[cache_key] = image
+        _memory_cache.move_to_end(cache_key)
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+    return image
+
+def pil_to_photoimage(image):
+    """
+    Convert a PIL image to a PhotoImage. Must be called on the Tk main thread.
+    
+    Args:
+        image: PIL.Image object
+    
+    Returns:
+        ImageTk.PhotoImage object, or None if conversion fails
     """
     try:
-        # Reduced timeout for faster failures
-        response = requests.get(url, timeout=5)
-        response.raise_for_status()
-        
-        # Open image from bytes
-        image = Image.open(BytesIO(response.content))
-        
-        # Resize image with faster algorithm for speed
-        image = image.resize((width, height), Image.Resampling.BILINEAR)
-        
-        # Convert to PhotoImage for Tkinter
         return ImageTk.PhotoImage(image)
+    except Exception:
+        return None
+
+def download_image(url, width=150, height=225):
+    """
+    Download an image from a URL and return it as a PhotoImage.
     
-    except Exception as e:
-        # Silent failure - just return None, don't print every error
+    Args:
+        url: The URL of the image
+        width: Target width for the image
+        height: Target height for the image
+    
+    Returns:
+        ImageTk.PhotoImage object, or None if download fails
+    """
+    image = fetch_and_decode_to_pil(url, width, height)
+    if image is None:
         return None
+    
+    # Convert to PhotoImage for Tkinter
+    return pil_to_photoimage(image)
 
 def get_placeholder_image(width=150, height=225):
     """
     Create a placeholder image when poster is not available.
+    The image is built once per size and reused afterwards.
     
     Args:
         width: Image width
@@ -56,36 +194,118 @@ def get_placeholder_image(width=150, height=225):
     Returns:
         ImageTk.PhotoImage object
     """
+    key = (width, height)
+    placeholder = _placeholder_cache.get(key)
+    if placeholder is not None:
+        return placeholder
+    
     try:
         # Create a gray placeholder image with loading text
-        from PIL import ImageDraw, ImageFont
-        
         image = Image.new('RGB', (width, height), color='#333333')
         draw = ImageDraw.Draw(image)
         
         # Add loading text
         text = "Loading..."
-        # Try to use a font, fall back to default if not available
-        try:
-            font = ImageFont.truetype("arial.ttf", 16)
-        except:
-            font = ImageFont.load_default()
         
         # Calculate text position (center)
-        bbox = draw.textbbox((0, 0), text, font=font)
+        bbox = draw.textbbox((0, 0), text, font=PLACEHOLDER_FONT)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
         position = ((width - text_width) // 2, (height - text_height) // 2)
         
         # Draw text
-        draw.text(position, text, fill='#888888', font=font)
+        draw.text(position, text, fill='#888888', font=PLACEHOLDER_FONT)
         
-        return ImageTk.PhotoImage(image)
+        placeholder = ImageTk.PhotoImage(image)
     except Exception as e:
         print(f"Error creating placeholder: {e}")
         # Fallback to simple gray box
         try:
             image = Image.new('RGB', (width, height), color='#333333')
-            return ImageTk.PhotoImage(image)
+            placeholder = ImageTk.PhotoImage(image)
         except:
             return None
+    
+    _placeholder_cache[key] = placeholder
+    return placeholder
+
+def _draw_star(draw, center_x, center_y, radius, fill):
+    """Draw a five-pointed star (emoji glyphs are missing from most fonts)."""
+    points = []
+    for i in range(10):
+        r = radius if i % 2 == 0 else radius * 0.45
+        angle = math.pi / 2 + i * math.pi / 5
+        points.append((center_x + r * math.cos(angle), center_y - r * math.sin(angle)))
+    draw.polygon(points, fill=fill)
+
+def _wrap_text(draw, text, font, max_width):
+    """Split text into lines that fit within max_width pixels."""
+    lines = []
+    line = ""
+    for word in text.split():
+        candidate = f"{line} {word}".strip()
+        if line and draw.textlength(candidate, font=font) > max_width:
+            lines.append(line)
+            line = word
+        else:
+            line = candidate
+    if line:
+        lines.append(line)
+    return "\n".join(lines)
+
+def render_poster_card(poster, rating, year, title, width=185, height=278):
+    """
+    Render a grid card with the rating badge and year drawn onto the image.
+    Safe to call from worker threads.
+    
+    Args:
+        poster: PIL.Image poster, or None to draw a title card instead
+        rating: Vote average shown in the top-left badge
+        year: Release year shown at the bottom
+        title: Title drawn on the card when there is no poster
+        width: Card width (posters within RESIZE_TOLERANCE keep their own size)
+        height: Card height
+    
+    Returns:
+        PIL.Image object
+    """
+    if poster is not None:
+        # convert() returns a copy, so the cached poster is never modified
+        image = poster.convert('RGB')
+        if not _close_to_size(image.size, width, height):
+            image = image.resize((width, height), Image.Resampling.BILINEAR)
+        width, height = image.size
+    else:
+        image = Image.new('RGB', (width, height), color='#e50914')
+    draw = ImageDraw.Draw(image)
+    
+    if poster is None:
+        # Title centered on the red card
+        text = _wrap_text(draw, title, TITLE_FONT, width - 20)
+        bbox = draw.multiline_textbbox((0, 0), text, font=TITLE_FONT, align='center')
+        position = ((width - (bbox[2] - bbox[0])) // 2 - bbox[0],
+                    (height - (bbox[3] - bbox[1])) // 2 - bbox[1])
+        draw.multiline_text(position, text, fill='#ffffff', font=TITLE_FONT, align='center')
+    
+    # Rating badge (top-left)
+    rating_text = f"{rating:.1f}"
+    bbox = draw.textbbox((0, 0), rating_text, font=RATING_FONT)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+    star_size = text_height
+    badge_right = 5 + 8 + star_size + 5 + text_width + 8
+    badge_bottom = 5 + 4 + text_height + 4
+    draw.rectangle((5, 5, badge_right, badge_bottom), fill='#000000')
+    _draw_star(draw, 13 + star_size / 2, 9 + text_height / 2, star_size / 2, '#FFD700')
+    draw.text((13 + star_size + 5 - bbox[0], 9 - bbox[1]), rating_text, fill='#FFD700', font=RATING_FONT)
+    
+    # Year (bottom-center)
+    bbox = draw.textbbox((0, 0), year, font=YEAR_FONT)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+    left = (width - text_width) // 2 - 8
+    top = height - 20 - text_height // 2 - 4
+    draw.rectangle((left, top, left + text_width + 16, top + text_height + 8), fill='#000000')
+    draw.text((left + 8 - bbox[0], top + 4 - bbox[1]), year, fill='#ffffff', font=YEAR_FONT)
+    
+    return image
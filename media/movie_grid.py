@@ -3,9 +3,65 @@ Movie Grid Display Module
 Handles the display of movies and TV shows in a grid layout.
 """
 import tkinter as tk
-import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from services.tmdb_api import get_poster_url
-from media.image_utils import download_image
+from media.image_utils import (
+    fetch_and_decode_to_pil, pil_to_photoimage,
+    get_placeholder_image, render_poster_card
+)
+
+# Number of posters downloaded in parallel
+POSTER_WORKERS = 8
+
+# Milliseconds between applying batches of finished posters to the grid
+POSTER_BATCH_INTERVAL = 50
+
+# Maximum number of grid cells kept around for reuse after clear()
+CELL_POOL_SIZE = 40
+
+# Card size matches TMDb's w185 posters so they can be shown without resizing
+POSTER_SIZE = "w185"
+POSTER_WIDTH = 185
+POSTER_HEIGHT = 278
+
+
+class Card:
+    """Display fields of a single movie/TV show, extracted once from the API item."""
+    
+    __slots__ = ("id", "title", "year", "rating", "poster_url", "data")
+    
+    def __init__(self, item_id, title, year, rating, poster_url, data):
+        self.id = item_id
+        self.title = title
+        self.year = year
+        self.rating = rating
+        self.poster_url = poster_url
+        self.data = data
+    
+    @classmethod
+    def from_item(cls, item, title_key, date_key):
+        """
+        Build a Card from a TMDb listing item.
+        
+        Args:
+            item: Movie or TV show dictionary from TMDb API
+            title_key: "title" for movies, "name" for TV shows
+            date_key: "release_date" for movies, "first_air_date" for TV shows
+        
+        Returns:
+            Card object
+        """
+        title = item.get(title_key, "Unknown Title")
+        date = item.get(date_key, "")
+        return cls(
+            item.get("id"),
+            title if len(title) <= 20 else title[:17] + "...",
+            date[:4] if date else "N/A",
+            item.get("vote_average", 0),
+            get_poster_url(item.get("poster_path"), POSTER_SIZE),
+            item
+        )
 
 
 class MovieGrid:
@@ -26,6 +82,22 @@ class MovieGrid:
         self.root = root
         self.show_details_callback = show_details_callback
         self.image_references = []
+        self._executor = ThreadPoolExecutor(max_workers=POSTER_WORKERS)
+        self._poster_futures = []
+        # Rendered cards waiting to be applied by _drain_pending on the main thread
+        self._pending = queue.Queue()
+        self._drain_job = None
+        # Cells are (item_frame, poster_label) pairs, recycled instead of rebuilt
+        self._active_cells = []
+        self._cell_pool = []
+        # Cell widget -> Card it currently shows, looked up when a cell is clicked
+        self._cell_cards = {}
+        self._item_type = None
+        # Bumped on clear() so late poster updates can't land on recycled cells
+        self._generation = 0
+        
+        # Stop poster workers with the window so exit doesn't wait on downloads
+        self.scrollable_frame.bind("<Destroy>", lambda e: self.shutdown())
     
     def display_items(self, items, item_type):
         """
@@ -45,22 +117,60 @@ class MovieGrid:
         # Track poster labels for background loading
         poster_labels = []
         
-        for item in items:
-            # Extract title and year
-            if item_type == "movie":
-                title = item.get("title", "Unknown Title")
-                release_date = item.get("release_date", "")
-                year = release_date[:4] if release_date else "N/A"
-            else:  # TV show
-                title = item.get("name", "Unknown Title")
-                first_air_date = item.get("first_air_date", "")
-                year = first_air_date[:4] if first_air_date else "N/A"
+        # Shared placeholder shown until each card has been rendered
+        placeholder = get_placeholder_image(POSTER_WIDTH, POSTER_HEIGHT)
+        if placeholder:
+            self.image_references.append(placeholder)
+        
+        # Extract the display fields of every item in one pass
+        if item_type == "movie":
+            title_key, date_key = "title", "release_date"
+        else:  # TV show
+            title_key, date_key = "name", "first_air_date"
+        cards = [Card.from_item(item, title_key, date_key) for item in items]
+        self._item_type = item_type
+        
+        for card in cards:
+            # Reuse a pooled cell when available, otherwise create one
+            item_frame, poster_label = self._get_cell(placeholder)
+            item_frame.grid(row=row, column=col, padx=10, pady=10, sticky="n")
+            
+            # Make clickable; _on_click finds the card when the cell is clicked
+            self._cell_cards[poster_label] = card
+            self._cell_cards[item_frame] = card
             
-            # Get rating and poster URL
-            rating = item.get("vote_average", 0)
-            poster_url = get_poster_url(item.get("poster_path"))
-            display_title = title if len(title) <= 20 else title[:17] + "..."
+            # Store for background loading
+            poster_labels.append((poster_label, card))
             
+            # Move to next position
+            col += 1
+            if col >= max_cols:
+                col = 0
+                row += 1
+        
+        # Reset canvas scroll to top; Tk lays out the new cells at idle time
+        self.canvas.yview_moveto(0)
+        
+        # Load actual posters in background
+        self._load_posters_async(poster_labels)
+        
+        return len(items)
+    
+    def _get_cell(self, placeholder):
+        """
+        Take a cell from the pool, or build a new one if the pool is empty.
+        
+        Args:
+            placeholder: Image to show until the card has been rendered
+        
+        Returns:
+            Tuple (item_frame, poster_label)
+        """
+        if self._cell_pool:
+            item_frame, poster_label = self._cell_pool.pop()
+            item_frame.config(bg="#2d2d2d")
+            poster_label.config(image=placeholder or "", bg="#1a1a1a")
+        else:
             # Create item frame
             item_frame = tk.Frame(
                 self.scrollable_frame,
@@ -68,117 +178,119 @@ class MovieGrid:
                 relief=tk.RAISED,
                 borderwidth=1
             )
-            item_frame.grid(row=row, column=col, padx=10, pady=10, sticky="n")
             
-            # Create poster label with placeholder card initially
+            # Single poster label; the rating and year are drawn onto the image itself
             poster_label = tk.Label(
                 item_frame,
-                width=180,
-                height=270,
-                bg="#e50914",
+                image=placeholder,
+                bg="#1a1a1a",
                 cursor="hand2"
             )
             poster_label.pack(padx=5, pady=5)
             
-            # Add placeholder content
-            placeholder_frame = tk.Frame(poster_label, bg="#e50914")
-            placeholder_frame.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
-            
-            # Rating badge
-            rating_frame = tk.Frame(poster_label, bg="#000000")
-            rating_frame.place(x=5, y=5)
-            tk.Label(
-                rating_frame,
-                text=f"⭐ {rating:.1f}",
-                font=("Arial", 12, "bold"),
-                bg="#000000",
-                fg="#FFD700",
-                padx=8,
-                pady=3
-            ).pack()
-            
-            # Title
-            tk.Label(
-                placeholder_frame,
-                text=display_title,
-                font=("Arial", 14, "bold"),
-                bg="#e50914",
-                fg="#ffffff",
-                wraplength=160,
-                justify=tk.CENTER
-            ).pack()
-            
-            # Year
-            year_frame = tk.Frame(poster_label, bg="#000000")
-            year_frame.place(relx=0.5, y=250, anchor=tk.CENTER)
-            tk.Label(
-                year_frame,
-                text=year,
-                font=("Arial", 10),
-                bg="#000000",
-                fg="#ffffff",
-                padx=8,
-                pady=3
-            ).pack()
-            
-            # Make clickable
-            item_id = item.get("id")
+            # Click and hover handlers don't depend on the item, so they are bound once per cell
             for widget in [poster_label, item_frame]:
-                widget.bind("<Button-1>", lambda e, i=item_id, t=item_type, d=item: self.show_details_callback(i, t, d))
-                widget.bind("<Enter>", lambda e, w=widget: w.config(bg="#444444"))
-                widget.bind("<Leave>", lambda e, w=widget: w.config(bg="#2d2d2d"))
-            
-            # Store for background loading
-            poster_labels.append((poster_label, poster_url, item_id, item_type, item))
-            
-            # Move to next position
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
+                widget.bind("<Button-1>", self._on_click)
+                widget.bind("<Enter>", self._on_enter)
+                widget.bind("<Leave>", self._on_leave)
         
-        # Reset canvas scroll to top and force update
-        self.canvas.yview_moveto(0)
-        self.root.update_idletasks()
-        
-        # Load actual posters in background
-        self._load_posters_async(poster_labels)
-        
-        return len(items)
+        self._active_cells.append((item_frame, poster_label))
+        return item_frame, poster_label
+    
+    def _on_click(self, event):
+        """Open the details for a clicked cell."""
+        card = self._cell_cards.get(event.widget)
+        if card is not None:
+            self.show_details_callback(card.id, self._item_type, card.data)
+    
+    def _on_enter(self, event):
+        """Highlight the hovered cell."""
+        event.widget.config(bg="#444444")
+    
+    def _on_leave(self, event):
+        """Remove the hover highlight."""
+        event.widget.config(bg="#2d2d2d")
     
     def _load_posters_async(self, poster_labels):
         """
-        Load posters in background thread.
+        Download posters and render the grid cards in parallel on the worker pool.
         
         Args:
-            poster_labels: List of tuples (label, url, id, type, data)
+            poster_labels: List of tuples (label, card)
         """
-        def load_posters():
-            for poster_label, poster_url, item_id, item_type, item_data in poster_labels:
-                if poster_url:
-                    poster_image = download_image(poster_url, width=180, height=270)
-                    if poster_image:
-                        # Update UI in main thread
-                        def update_poster(label=poster_label, img=poster_image, iid=item_id, itype=item_type, idata=item_data):
-                            try:
-                                if label.winfo_exists():
-                                    self.image_references.append(img)
-                                    label.config(image=img, bg="#1a1a1a")
-                                    # Clear old placeholder widgets
-                                    for child in label.winfo_children():
-                                        child.destroy()
-                                    # Re-bind click event
-                                    label.bind("<Button-1>", lambda e: self.show_details_callback(iid, itype, idata))
-                            except:
-                                pass
-                        
-                        self.root.after(0, update_poster)
-        
-        # Start background loading
-        threading.Thread(target=load_posters, daemon=True).start()
+        generation = self._generation
+        for poster_label, card in poster_labels:
+            future = self._executor.submit(self._render_into_queue, card, poster_label, generation)
+            self._poster_futures.append(future)
+        
+        # Apply finished posters in batches rather than one Tk callback each
+        if self._drain_job is None:
+            self._drain_job = self.root.after(POSTER_BATCH_INTERVAL, self._drain_pending)
+    
+    def _render_into_queue(self, card, label, generation):
+        """Render a card and queue it for the main thread (runs on a worker thread)."""
+        self._pending.put((label, _render_card(card), generation))
+    
+    def _drain_pending(self):
+        """Apply every queued poster, then check again while downloads remain."""
+        self._drain_job = None
+        while True:
+            try:
+                label, image, generation = self._pending.get_nowait()
+            except queue.Empty:
+                break
+            self._update_poster(label, image, generation)
+        
+        # A finished future has always queued its card, so nothing can be missed
+        if any(not future.done() for future in self._poster_futures):
+            self._drain_job = self.root.after(POSTER_BATCH_INTERVAL, self._drain_pending)
+    
+    def _update_poster(self, label, image, generation):
+        """Swap the placeholder for the rendered card (runs on the main thread)."""
+        if generation != self._generation:
+            return  # The grid was cleared and this label may now show another item
+        try:
+            if label.winfo_exists():
+                img = pil_to_photoimage(image)
+                if img is None:
+                    return
+                self.image_references.append(img)
+                label.config(image=img)
+        except tk.TclError:
+            pass  # Label destroyed while the poster was loading
     
     def clear(self):
         """Clear all displayed items."""
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        # Drop downloads that have not started yet
+        for future in self._poster_futures:
+            future.cancel()
+        self._poster_futures.clear()
+        self._generation += 1
+        
+        # Hide cells and keep them for the next display_items call
+        for item_frame, poster_label in self._active_cells:
+            item_frame.grid_forget()
+            if len(self._cell_pool) < CELL_POOL_SIZE:
+                self._cell_pool.append((item_frame, poster_label))
+            else:
+                item_frame.destroy()
+        self._active_cells.clear()
+        # Forget the items so hidden cells don't keep them alive
+        self._cell_cards.clear()
+        # Other children of scrollable_frame (loading indicator, messages)
+        # belong to the caller and are left alone
         self.image_references.clear()
+    
+    def shutdown(self):
+        """Cancel queued poster downloads and release the worker pool."""
+        # Cancel by hand; shutdown(cancel_futures=True) needs Python 3.9
+        for future in self._poster_futures:
+            future.cancel()
+        self._poster_futures.clear()
+        self._executor.shutdown(wait=False)
+
+
+def _render_card(card):
+    """Fetch a poster (if any) and draw the grid card for it (runs on a worker thread)."""
+    poster = fetch_and_decode_to_pil(card.poster_url, POSTER_WIDTH, POSTER_HEIGHT) if card.poster_url else None
+    return render_poster_card(poster, card.rating, card.year, card.title, POSTER_WIDTH, POSTER_HEIGHT)
@@ -3,16 +3,199 @@ TMDb API Service Module
 Handles all interactions with The Movie Database API.
 """
 import requests
-import sys
-import os
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import functools
+import inspect
+import threading
+import time
+
+# orjson parses JSON considerably faster; fall back to the standard library
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
-# Add parent directory to path to import config
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import TMDB_API_KEY, REQUEST_TIMEOUT
 
 BASE_URL = "https://api.themoviedb.org/3/"
 IMAGE_BASE_URL = "https://image.tmdb.org/t/p/"
 
+# Seconds to wait for the connection; REQUEST_TIMEOUT still bounds each read
+CONNECT_TIMEOUT = 3
+TIMEOUT = (CONNECT_TIMEOUT, REQUEST_TIMEOUT)
+
+# Endpoint URLs and shared query parameters, built once at import
+_CONFIGURATION_URL = BASE_URL + "configuration"
+_POPULAR_MOVIES_URL = BASE_URL + "movie/popular"
+_POPULAR_TV_URL = BASE_URL + "tv/popular"
+_SEARCH_MOVIES_URL = BASE_URL + "search/movie"
+_SEARCH_TV_URL = BASE_URL + "search/tv"
+_MOVIE_DETAILS_URL = BASE_URL + "movie/{}"
+_TV_DETAILS_URL = BASE_URL + "tv/{}"
+_MOVIE_VIDEOS_URL = BASE_URL + "movie/{}/videos"
+_TV_VIDEOS_URL = BASE_URL + "tv/{}/videos"
+# Never mutated; copy it when a request needs extra parameters
+_DEFAULT_PARAMS = {"api_key": TMDB_API_KEY, "language": "en-US"}
+
+def _build_retry():
+    """
+    Build the retry policy for TMDb requests: exponential backoff with jitter
+    on throttling and server errors, honoring TMDb's Retry-After header.
+    Connection failures and read timeouts are retried at most once, so an
+    offline or stalled network still fails fast.
+    """
+    options = dict(
+        total=4,
+        connect=1,
+        read=1,
+        status=4,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "HEAD"],
+        respect_retry_after_header=True
+    )
+    try:
+        return Retry(backoff_jitter=0.3, **options)
+    except TypeError:
+        # urllib3 < 2.0 has no backoff_jitter
+        return Retry(**options)
+
+# Shared session so every API call reuses pooled keep-alive connections
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_build_retry()))
+
+# Response cache settings (TTLs in seconds)
+CACHE_MAX_ENTRIES = 256
+POPULAR_CACHE_TTL = 10 * 60
+DETAILS_CACHE_TTL = 24 * 60 * 60
+
+def get_session():
+    """
+    Get the shared session used for all TMDb API requests.
+    
+    Returns:
+        requests.Session object
+    """
+    return _session
+
+def prewarm_connection():
+    """
+    Open a keep-alive connection to TMDb ahead of the first real request,
+    so the TCP and TLS handshakes are already done when it is made.
+    """
+    try:
+        _session.head(_CONFIGURATION_URL, params={"api_key": TMDB_API_KEY}, timeout=TIMEOUT)
+    except requests.exceptions.RequestException:
+        pass  # Best-effort; the real request will connect on its own
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries expire after a per-entry TTL."""
+    
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, value), oldest first
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Return (True, value) for a live entry, otherwise (False, None)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+    
+    def set(self, key, value, ttl):
+        """Store a value for ttl seconds, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+_cache = _TTLCache(CACHE_MAX_ENTRIES)
+# Fetches currently running, keyed like _cache, so concurrent callers share one request
+_in_flight = {}
+_in_flight_lock = threading.Lock()
+
+def ttl_cache(seconds):
+    """
+    Cache a fetch function's result in memory for the given number of seconds.
+    Empty results are not cached, since the fetchers return []/None on errors.
+    Concurrent calls with the same arguments wait for a single fetch.
+    The wrapper's is_cached(*args, **kwargs) tells whether a call would
+    be served without starting a new request.
+    
+    Args:
+        seconds: How long a cached response stays valid
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        
+        def make_key(args, kwargs):
+            # Bind to the signature so f(), f(1) and f(page=1) share one entry
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return (func.__name__, tuple(bound.arguments.items()))
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            hit, value = _cache.get(key)
+            if hit:
+                return value
+            
+            # Join a fetch already running for this key, or become its owner
+            with _in_flight_lock:
+                hit, value = _cache.get(key)
+                if hit:
+                    return value
+                future = _in_flight.get(key)
+                owner = future is None
+                if owner:
+                    future = _in_flight[key] = Future()
+            if not owner:
+                return future.result()
+            
+            try:
+                value = func(*args, **kwargs)
+                if value:
+                    _cache.set(key, value, seconds)
+                future.set_result(value)
+                return value
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with _in_flight_lock:
+                    del _in_flight[key]
+        
+        def is_cached(*args, **kwargs):
+            key = make_key(args, kwargs)
+            with _in_flight_lock:
+                return key in _in_flight or _cache.get(key)[0]
+        
+        wrapper.is_cached = is_cached
+        return wrapper
+    return decorator
+
+def clear_cache():
+    """Drop all cached TMDb responses."""
+    _cache.clear()
+
+@ttl_cache(POPULAR_CACHE_TTL)
 def get_popular_movies(page=1):
     """
     Fetch popular movies from TMDb.
@@ -23,15 +206,16 @@ def get_popular_movies(page=1):
     Returns:
         List of movie dictionaries with title, release_date, poster_path, etc.
     """
-    url = f"{BASE_URL}movie/popular?api_key={TMDB_API_KEY}&language=en-US&page={page}"
+    params = {**_DEFAULT_PARAMS, "page": page}
     try:
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
+        response = _session.get(_POPULAR_MOVIES_URL, params=params, timeout=TIMEOUT)
         response.raise_for_status()
-        return response.json().get("results", [])
-    except requests.exceptions.RequestException as e:
+        return json_loads(response.content).get("results", [])
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Error fetching movies: {e}")
         return []
 
+@ttl_cache(POPULAR_CACHE_TTL)
 def get_popular_tv(page=1):
     """
     Fetch popular TV shows from TMDb.
@@ -42,12 +226,12 @@ def get_popular_tv(page=1):
     Returns:
         List of TV show dictionaries with name, first_air_date, poster_path, etc.
     """
-    url = f"{BASE_URL}tv/popular?api_key={TMDB_API_KEY}&language=en-US&page={page}"
+    params = {**_DEFAULT_PARAMS, "page": page}
     try:
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
+        response = _session.get(_POPULAR_TV_URL, params=params, timeout=TIMEOUT)
         response.raise_for_status()
-        return response.json().get("results", [])
-    except requests.exceptions.RequestException as e:
+        return json_loads(response.content).get("results", [])
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Error fetching TV shows: {e}")
         return []
 
@@ -76,12 +260,12 @@ def search_movies(query):
     Returns:
         List of movie dictionaries matching the search
     """
-    url = f"{BASE_URL}search/movie?api_key={TMDB_API_KEY}&language=en-US&query={query}&page=1"
+    params = {**_DEFAULT_PARAMS, "query": query, "page": 1}
     try:
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
+        response = _session.get(_SEARCH_MOVIES_URL, params=params, timeout=TIMEOUT)
         response.raise_for_status()
-        return response.json().get("results", [])
-    except requests.exceptions.RequestException as e:
+        return json_loads(response.content).get("results", [])
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Error searching movies: {e}")
         return []
 
@@ -95,15 +279,16 @@ def search_tv(query):
     Returns:
         List of TV show dictionaries matching the search
     """
-    url = f"{BASE_URL}search/tv?api_key={TMDB_API_KEY}&language=en-US&query={query}&page=1"
+    params = {**_DEFAULT_PARAMS, "query": query, "page": 1}
     try:
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
+        response = _session.get(_SEARCH_TV_URL, params=params, timeout=TIMEOUT)
         response.raise_for_status()
-        return response.json().get("results", [])
-    except requests.exceptions.RequestException as e:
+        return json_loads(response.content).get("results", [])
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Error searching TV shows: {e}")
         return []
 
+@ttl_cache(DETAILS_CACHE_TTL)
 def get_movie_details(movie_id):
     """
     Get detailed information about a specific movie.
@@ -114,15 +299,15 @@ def get_movie_details(movie_id):
     Returns:
         Dictionary with movie details including runtime, genres, overview, etc.
     """
-    url = f"{BASE_URL}movie/{movie_id}?api_key={TMDB_API_KEY}&language=en-US"
     try:
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
+        response = _session.get(_MOVIE_DETAILS_URL.format(movie_id), params=_DEFAULT_PARAMS, timeout=TIMEOUT)
         response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        return json_loads(response.content)
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Error fetching movie details: {e}")
         return None
 
+@ttl_cache(DETAILS_CACHE_TTL)
 def get_tv_details(tv_id):
     """
     Get detailed information about a specific TV show.
@@ -133,15 +318,15 @@ def get_tv_details(tv_id):
     Returns:
         Dictionary with TV show details including seasons, genres, overview, etc.
     """
-    url = f"{BASE_URL}tv/{tv_id}?api_key={TMDB_API_KEY}&language=en-US"
     try:
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
+        response = _session.get(_TV_DETAILS_URL.format(tv_id), params=_DEFAULT_PARAMS, timeout=TIMEOUT)
         response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        return json_loads(response.content)
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Error fetching TV show details: {e}")
         return None
 
+@ttl_cache(DETAILS_CACHE_TTL)
 def get_movie_videos(movie_id):
     """
     Get videos (trailers, teasers, etc.) for a specific movie.
@@ -152,15 +337,15 @@ def get_movie_videos(movie_id):
     Returns:
         List of video dictionaries with keys, types, and sites
     """
-    url = f"{BASE_URL}movie/{movie_id}/videos?api_key={TMDB_API_KEY}&language=en-US"
     try:
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
+        response = _session.get(_MOVIE_VIDEOS_URL.format(movie_id), params=_DEFAULT_PARAMS, timeout=TIMEOUT)
         response.raise_for_status()
-        return response.json().get("results", [])
-    except requests.exceptions.RequestException as e:
+        return json_loads(response.content).get("results", [])
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Error fetching movie videos: {e}")
         return []
 
+@ttl_cache(DETAILS_CACHE_TTL)
 def get_tv_videos(tv_id):
     """
     Get videos (trailers, teasers, etc.) for a specific TV show.
@@ -171,15 +356,44 @@ def get_tv_videos(tv_id):
     Returns:
         List of video dictionaries with keys, types, and sites
     """
-    url = f"{BASE_URL}tv/{tv_id}/videos?api_key={TMDB_API_KEY}&language=en-US"
     try:
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
+        response = _session.get(_TV_VIDEOS_URL.format(tv_id), params=_DEFAULT_PARAMS, timeout=TIMEOUT)
         response.raise_for_status()
-        return response.json().get("results", [])
-    except requests.exceptions.RequestException as e:
+        return json_loads(response.content).get("results", [])
+    except (requests.exceptions.RequestException, ValueError) as e:
         print(f"Error fetching TV show videos: {e}")
         return []
 
+def get_movie_bundle(movie_id):
+    """
+    Fetch a movie's details and videos concurrently over the shared session.
+    
+    Args:
+        movie_id: The TMDb movie ID
+    
+    Returns:
+        Tuple (details, videos) as returned by get_movie_details and get_movie_videos
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        details = executor.submit(get_movie_details, movie_id)
+        videos = executor.submit(get_movie_videos, movie_id)
+        return details.result(), videos.result()
+
+def get_tv_bundle(tv_id):
+    """
+    Fetch a TV show's details and videos concurrently over the shared session.
+    
+    Args:
+        tv_id: The TMDb TV show ID
+    
+    Returns:
+        Tuple (details, videos) as returned by get_tv_details and get_tv_videos
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        details = executor.submit(get_tv_details, tv_id)
+        videos = executor.submit(get_tv_videos, tv_id)
+        return details.result(), videos.result()
+
 def get_youtube_url(video_key):
     """
     Build YouTube URL from TMDb video key.
@@ -5,7 +5,63 @@ Handles user authentication UI.
 import tkinter as tk
 from tkinter import messagebox
 from database.user_auth import verify_user
-from PIL import Image, ImageTk, ImageFilter
+from PIL import Image, ImageTk, ImageFilter, UnidentifiedImageError
+import hashlib
+import os
+import threading
+
+BACKGROUND_PATH = "assets/images/moviebg.jpg"
+
+# Lookup table that scales each channel value to 60% to darken the background
+DARKEN_LUT = [int(value * 0.6) for value in range(256)]
+
+# Darkened, screen-sized backgrounds are cached here between launches
+BACKGROUND_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".movieflix_cache")
+
+
+def _load_background(screen_width, screen_height):
+    """
+    Load the login background resized to the screen and darkened.
+    The result is cached on disk per screen size and source image version.
+    
+    Args:
+        screen_width: Screen width in pixels
+        screen_height: Screen height in pixels
+    
+    Returns:
+        PIL.Image object
+    """
+    key = f"{screen_width}x{screen_height}:{os.path.getmtime(BACKGROUND_PATH)}"
+    cache_name = f"bg_{hashlib.sha1(key.encode()).hexdigest()}.png"
+    cache_path = os.path.join(BACKGROUND_CACHE_DIR, cache_name)
+    if os.path.exists(cache_path):
+        return Image.open(cache_path)
+    
+    bg_image = Image.open(BACKGROUND_PATH)
+    # Let libjpeg decode at a reduced scale that still covers the screen
+    bg_image.draft("RGB", (screen_width, screen_height))
+    # Resize to screen size (before darkening, so the darken pass runs on
+    # the smaller of the two images)
+    bg_image = bg_image.resize((screen_width, screen_height), Image.Resampling.LANCZOS)
+    # Darken the image slightly (one C-level table lookup per channel)
+    bg_image = bg_image.point(DARKEN_LUT * len(bg_image.getbands()))
+    
+    # Write to a temporary file first so a partial write is never picked up
+    try:
+        os.makedirs(BACKGROUND_CACHE_DIR, exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        bg_image.save(temp_path, "PNG", optimize=True)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass  # Caching is best-effort
+    return bg_image
+
+
+def _prewarm_tmdb():
+    """Open a pooled TMDb connection (runs on a worker thread)."""
+    # Imported here so requests loads off the main thread
+    from services.tmdb_api import prewarm_connection
+    prewarm_connection()
 
 
 class LoginWindow:
@@ -23,32 +79,26 @@ class LoginWindow:
         self.on_success_callback = on_success_callback
         
         self.setup_ui()
+        
+        # Warm up the TMDb connection while the user types their credentials
+        threading.Thread(target=_prewarm_tmdb, daemon=True).start()
     
     def setup_ui(self):
         """Initialize the login interface."""
         self.root.title("Movies & TV Shows Browser - Login")
         
-        # Set fullscreen mode
+        # Set fullscreen mode; solid dark background until the image is ready
         self.root.state('zoomed')
-        self.root.configure(bg="#000000")
+        self.root.configure(bg="#141414")
         
-        # Load background image
-        try:
-            bg_image = Image.open("assets/images/moviebg.jpg")
-            # Resize to screen size
-            screen_width = self.root.winfo_screenwidth()
-            screen_height = self.root.winfo_screenheight()
-            bg_image = bg_image.resize((screen_width, screen_height), Image.Resampling.LANCZOS)
-            # Darken the image slightly
-            bg_image = bg_image.point(lambda p: int(p * 0.6))
-            self.bg_photo = ImageTk.PhotoImage(bg_image)
-            
-            # Background label
-            bg_label = tk.Label(self.root, image=self.bg_photo)
-            bg_label.place(x=0, y=0, relwidth=1, relheight=1)
-        except:
-            # Fallback to solid dark background
-            self.root.configure(bg="#141414")
+        # Load background image in background thread
+        screen_width = self.root.winfo_screenwidth()
+        screen_height = self.root.winfo_screenheight()
+        threading.Thread(
+            target=self._prepare_bg,
+            args=(screen_width, screen_height),
+            daemon=True
+        ).start()
         
         # Center login container with semi-transparent black background
         login_container = tk.Frame(self.root, bg="#000000")
@@ -142,6 +192,29 @@ class LoginWindow:
         # Focus on username entry
         self.username_entry.focus()
     
+    def _prepare_bg(self, screen_width, screen_height):
+        """Load and decode the background image (runs on a worker thread)."""
+        try:
+            bg_image = _load_background(screen_width, screen_height)
+            bg_image.load()
+        except (OSError, UnidentifiedImageError):
+            return  # Missing or unreadable image; keep the solid dark background
+        try:
+            self.root.after(0, self._install_bg, bg_image)
+        except (RuntimeError, tk.TclError):
+            pass  # Login window already closed
+    
+    def _install_bg(self, bg_image):
+        """Show the loaded background behind the login form."""
+        if not self.root.winfo_exists():
+            return
+        self.bg_photo = ImageTk.PhotoImage(bg_image)
+        
+        # Background label
+        bg_label = tk.Label(self.root, image=self.bg_photo)
+        bg_label.place(x=0, y=0, relwidth=1, relheight=1)
+        bg_label.lower()
+    
     def _on_username_focus_in(self, event):
         """Clear placeholder on focus."""
         if self.username_entry.get() == "Email or phone number":
@@ -19,6 +19,8 @@ class MovieApp:
         self.current_view = "movies"
         self.loading = False
         self.loading_animation_id = None
+        self._sr_job = None
+        self.message_label = None
         
         # Initialize movie grid handler
         self.movie_grid = None
@@ -87,10 +89,7 @@ class MovieApp:
         self.canvas = tk.Canvas(content_frame, bg="#1a1a1a", highlightthickness=0)
         
         self.scrollable_frame = tk.Frame(self.canvas, bg="#1a1a1a")
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        self.scrollable_frame.bind("<Configure>", self._schedule_scrollregion)
         
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=scrollbar.set)
@@ -98,11 +97,32 @@ class MovieApp:
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
+        # Loading indicator, created once and packed only while loading
+        self.loading_frame = tk.Frame(self.scrollable_frame, bg="#1a1a1a")
+        
+        # Spinner
+        self.loading_label = tk.Label(
+            self.loading_frame,
+            font=("Arial", 16),
+            bg="#1a1a1a",
+            fg="#ffffff"
+        )
+        self.loading_label.pack()
+        
+        # Progress bar
+        self.progress = ttk.Progressbar(
+            self.loading_frame,
+            mode='indeterminate',
+            length=300
+        )
+        self.progress.pack(pady=20)
+        
         # Initialize movie grid handler
         self.movie_grid = MovieGrid(self.scrollable_frame, self.canvas, self.root, self.show_details)
         
-        # Enable mouse wheel scrolling
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        # Enable mouse wheel scrolling only while the pointer is over the grid
+        self.canvas.bind("<Enter>", self._bind_mousewheel)
+        self.canvas.bind("<Leave>", self._unbind_mousewheel)
         
         # Status bar
         self.status_label = tk.Label(
@@ -116,6 +136,30 @@ class MovieApp:
         )
         self.status_label.pack(fill=tk.X, side=tk.BOTTOM)
     
+    def _schedule_scrollregion(self, event=None):
+        """Debounce scrollregion updates while the grid is being built."""
+        if self._sr_job:
+            self.root.after_cancel(self._sr_job)
+        self._sr_job = self.root.after(50, self._update_scrollregion)
+    
+    def _update_scrollregion(self):
+        """Recompute the canvas scrollregion from its contents."""
+        self._sr_job = None
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    
+    def _bind_mousewheel(self, event):
+        """Route mouse wheel events to the canvas."""
+        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+    
+    def _unbind_mousewheel(self, event):
+        """Stop routing mouse wheel events once the pointer leaves the canvas."""
+        # Moving onto a poster inside the canvas also fires <Leave>
+        x = event.x_root - self.canvas.winfo_rootx()
+        y = event.y_root - self.canvas.winfo_rooty()
+        if 0 <= x < self.canvas.winfo_width() and 0 <= y < self.canvas.winfo_height():
+            return
+        self.canvas.unbind_all("<MouseWheel>")
+    
     def _on_mousewheel(self, event):
         """Handle mouse wheel scrolling."""
         self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
@@ -124,6 +168,20 @@ class MovieApp:
         """Clear all content from the scrollable frame."""
         if self.movie_grid:
             self.movie_grid.clear()
+        if self.message_label:
+            self.message_label.destroy()
+            self.message_label = None
+    
+    def show_message(self, text):
+        """Show a message in place of the grid."""
+        self.message_label = tk.Label(
+            self.scrollable_frame,
+            text=text,
+            font=("Arial", 12),
+            bg="#1a1a1a",
+            fg="#ffffff"
+        )
+        self.message_label.pack(pady=50)
     
     def update_button_styles(self, active_button):
         """Update button styles to highlight active view."""
@@ -141,7 +199,6 @@ class MovieApp:
         
         self.current_view = "movies"
         self.update_button_styles("movies")
-        self.clear_content()
         self.show_loading("Loading popular movies")
         
         # Load in background thread
@@ -157,18 +214,16 @@ class MovieApp:
         
         if not movies:
             self.status_label.config(text="Failed to load movies. Check your API key and internet connection.")
-            tk.Label(
-                self.scrollable_frame,
-                text="No movies available. Please check your TMDb API key in config.py",
-                font=("Arial", 12),
-                bg="#1a1a1a",
-                fg="#ffffff"
-            ).pack(pady=50)
+            self.show_message("No movies available. Please check your TMDb API key in config.py")
             return
         
         # Use movie_grid to display items
         count = self.movie_grid.display_items(movies, "movie")
+        self._schedule_scrollregion()
         self.status_label.config(text=f"Showing {count} popular movies - Click any poster for details")
+        
+        # Users usually switch tabs next; warm the TV list into the API cache
+        self._prefetch(get_popular_tv)
     
     def load_tv_shows(self):
         """Load and display popular TV shows."""
@@ -177,7 +232,6 @@ class MovieApp:
         
         self.current_view = "tv"
         self.update_button_styles("tv")
-        self.clear_content()
         self.show_loading("Loading popular TV shows")
         
         # Load in background thread
@@ -193,48 +247,37 @@ class MovieApp:
         
         if not tv_shows:
             self.status_label.config(text="Failed to load TV shows. Check your API key and internet connection.")
-            tk.Label(
-                self.scrollable_frame,
-                text="No TV shows available. Please check your TMDb API key in config.py",
-                font=("Arial", 12),
-                bg="#1a1a1a",
-                fg="#ffffff"
-            ).pack(pady=50)
+            self.show_message("No TV shows available. Please check your TMDb API key in config.py")
             return
         
         # Use movie_grid to display items
         count = self.movie_grid.display_items(tv_shows, "tv")
+        self._schedule_scrollregion()
         self.status_label.config(text=f"Showing {count} popular TV shows - Click any poster for details")
+        
+        # Users usually switch tabs next; warm the movie list into the API cache
+        self._prefetch(get_popular_movies)
+    
+    def _prefetch(self, fetch):
+        """Run a cached TMDb fetch in the background so a later call is instant."""
+        # A later call joins a prefetch that is still running, so skip when
+        # the result is already cached or on its way
+        if not fetch.is_cached():
+            threading.Thread(target=fetch, daemon=True).start()
     
     def show_loading(self, message="Loading"):
         """Show loading indicator."""
         self.loading = True
         self.clear_content()
         
-        # Loading container
-        self.loading_frame = tk.Frame(self.scrollable_frame, bg="#1a1a1a")
-        self.loading_frame.pack(expand=True, fill=tk.BOTH, pady=100)
-        
-        # Spinner
-        self.loading_label = tk.Label(
-            self.loading_frame,
-            text=f"⏳ {message}",
-            font=("Arial", 16),
-            bg="#1a1a1a",
-            fg="#ffffff"
-        )
-        self.loading_label.pack()
-        
-        # Progress bar
-        self.progress = ttk.Progressbar(
-            self.loading_frame,
-            mode='indeterminate',
-            length=300
-        )
-        self.progress.pack(pady=20)
+        # Reuse the loading container built in setup_ui
+        self.loading_label.config(text=f"⏳ {message}")
         self.progress.start(10)
+        self.loading_frame.pack(expand=True, fill=tk.BOTH, pady=100)
         
         # Animate loading text
+        base_text = f"⏳ {message}"
+        self.loading_texts = [base_text + "." * dots for dots in range(4)]
         self.loading_dots = 0
         self.animate_loading()
         
@@ -242,16 +285,16 @@ class MovieApp:
     
     def animate_loading(self):
         """Animate loading text with dots."""
-        if self.loading and hasattr(self, 'loading_label'):
+        if self.loading:
             try:
                 if self.loading_label.winfo_exists():
-                    base_text = self.loading_label.cget("text").split(".")[0]
-                    dots = "." * (self.loading_dots % 4)
-                    self.loading_label.config(text=f"{base_text}{dots}")
+                    # Nothing to repaint while the window is minimized
+                    if self.root.state() != 'iconic':
+                        self.loading_label.config(text=self.loading_texts[self.loading_dots % 4])
                     self.loading_dots += 1
-                    self.loading_animation_id = self.root.after(400, self.animate_loading)
-            except:
-                pass
+                    self.loading_animation_id = self.root.after(600, self.animate_loading)
+            except tk.TclError:
+                pass  # Window is being torn down
     
     def hide_loading(self):
         """Hide loading indicator."""
@@ -259,17 +302,12 @@ class MovieApp:
         if self.loading_animation_id:
             self.root.after_cancel(self.loading_animation_id)
             self.loading_animation_id = None
-        if hasattr(self, 'progress'):
-            try:
-                self.progress.stop()
-            except:
-                pass
-        # Remove the loading frame from the UI
-        if hasattr(self, 'loading_frame'):
-            try:
-                self.loading_frame.destroy()
-            except:
-                pass
+        try:
+            self.progress.stop()
+            # Hide the loading frame; it is reused by the next load
+            self.loading_frame.pack_forget()
+        except tk.TclError:
+            pass  # Window is being torn down
     
     def show_details(self, item_id, item_type, item_data):
         """Show detailed information dialog."""